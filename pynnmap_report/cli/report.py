@@ -5,8 +5,6 @@ import click
 
 from pynnmap.parser import parameter_parser_factory as ppf
 
-from ..report import lemma_accuracy_report as lar
-
 
 @click.command(short_help="Run accuracy assessment report on model output")
 @click.argument("parameter-file", type=click.Path(exists=True), required=True)
@@ -16,5 +14,10 @@ def report(parameter_file):
     """
     params = ppf.get_parameter_parser(parameter_file)
     if params.accuracy_assessment_report:
+        # Importing the report pulls in reportlab, matplotlib and the font
+        # registration, so only pay for that when a report is requested
+        # pylint: disable=import-outside-toplevel
+        from ..report import lemma_accuracy_report as lar
+
         aa_report = lar.LemmaAccuracyReport(params)
         aa_report.create_accuracy_report()
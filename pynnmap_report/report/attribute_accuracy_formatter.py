@@ -2,8 +2,11 @@
 Accuracy formatter for all information in a single page
 """
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 
+import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from reportlab.lib.units import inch
@@ -17,55 +20,80 @@ from reportlab.platypus import (
 
 from pynnmap.misc import utilities
 from pynnmap.misc.classification_accuracy import Classifier, Classification
-from pynnmap.parser.xml_stand_metadata_parser import (
-    Flags,
-    XMLStandMetadataParser,
-)
+from pynnmap.parser.xml_stand_metadata_parser import Flags
 
 from . import chart_func as cf
-from .report_formatter import ReportFormatter
+from .report_formatter import (
+    ReportFormatter,
+    get_stand_metadata_parser,
+    make_image_dir,
+    read_accuracy_file,
+)
 from .accuracy_intro_formatter import AccuracyIntroductionFormatter
 
 
-def local_image_fn(attr):
+# Number of local scatterplots below which they are drawn in this process,
+# and the most worker processes used to draw them otherwise
+MIN_PARALLEL_FIGURES = 4
+MAX_FIGURE_WORKERS = 4
+
+
+def local_image_fn(attr, image_dir=""):
     """File name for local accuracy scatterplot image"""
-    return f"{attr.field_name.lower()}.png"
+    return os.path.join(image_dir, f"{attr.field_name.lower()}.png")
 
 
-def create_local_figures(df, attrs):
+def create_local_figures(df, attrs, image_dir=""):
     """
     Given a set of attributes and a dataframe of predicted and observed
-    values, create a set of scatterplots and return the list of filenames
+    values, create a set of scatterplots and return the list of filenames.
+    The scatterplots are independent and dominated by the kernel density
+    estimate, so they are drawn in separate processes unless there are
+    only a few of them
     """
-    files = []
+    jobs = []
     for attr in attrs:
-        fn = local_image_fn(attr)
-        cf.draw_scatterplot(df, attr, output_file=fn, kde=True)
-        files.append(fn)
-    return files
-
-
-def regional_image_fn(attr):
+        name = attr.field_name
+        obs = df[f"{name}_O"].to_numpy()
+        prd = df[f"{name}_P"].to_numpy()
+        fig_attr = cf.FigureAttribute(name, attr.units)
+        jobs.append((obs, prd, fig_attr, local_image_fn(attr, image_dir)))
+    if len(jobs) < MIN_PARALLEL_FIGURES:
+        return [cf.draw_observed_predicted(*job) for job in jobs]
+    max_workers = min(len(jobs), MAX_FIGURE_WORKERS, os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(cf.draw_observed_predicted, *zip(*jobs)))
+
+
+def regional_image_fn(attr, image_dir=""):
     """File name for regional accuracy histogram image"""
-    return f"{attr.field_name.lower()}_area.png"
+    return os.path.join(image_dir, f"{attr.field_name.lower()}_area.png")
 
 
-def create_regional_figures(area_df, olofsson_df, attrs):
+def create_regional_figures(area_df, olofsson_df, attrs, image_dir=""):
     """
     Given a set of attributes and a dataframe of predicted and observed
-    area values, create a set of histograms and return the list of filenames
+    area values, create a set of histograms and return the list of filenames.
+    A single figure is cleared and redrawn for each attribute
     """
     files = []
-    for attr in attrs:
-        fn = regional_image_fn(attr)
-        cf.draw_histogram(area_df, olofsson_df, attr, output_file=fn)
-        files.append(fn)
+    figure = plt.figure()
+    try:
+        for attr in attrs:
+            fn = regional_image_fn(attr, image_dir)
+            cf.draw_histogram(
+                area_df, olofsson_df, attr, output_file=fn, figure=figure
+            )
+            files.append(fn)
+    finally:
+        plt.close(figure)
     return files
 
 
-def riemann_image_fn(attr, resolution):
+def riemann_image_fn(attr, resolution, image_dir=""):
     """File name for Riemann mid-scale accuracy image based on resolution"""
-    return f"hex_{resolution}_{attr.field_name.lower()}.png"
+    fn = f"hex_{resolution}_{attr.field_name.lower()}.png"
+    return os.path.join(image_dir, fn)
 
 
 def get_riemann_fn(riemann_dir, resolution, k=7, observed=True):
@@ -79,7 +107,7 @@ def get_riemann_fn(riemann_dir, resolution, k=7, observed=True):
     )
 
 
-def create_riemann_figures(riemann_dir, k, attrs):
+def create_riemann_figures(riemann_dir, k, attrs, image_dir=""):
     """
     Given a set of attributes, create a set of scatterplots across all
     Riemann resolutions and return the list of filenames
@@ -97,7 +125,7 @@ def create_riemann_figures(riemann_dir, k, attrs):
             observed_file, predicted_file, id_field, attr_fields
         )
         for attr in attrs:
-            fn = riemann_image_fn(attr, resolution)
+            fn = riemann_image_fn(attr, resolution, image_dir)
             kwargs = {
                 "kde": False,
                 "xlabel": f"Predicted mean {attr.field_name} ({attr.units})",
@@ -116,6 +144,21 @@ class AttributeAccuracyFormatter(ReportFormatter):
     and mid-scale graphics for inclusion into a single page
     """
 
+    __slots__ = (
+        "stand_metadata_file",
+        "observed_file",
+        "predicted_file",
+        "id_field",
+        "riemann_dir",
+        "k",
+        "image_files",
+        "image_dir",
+        "error_matrix_df",
+        "bins_df",
+        "area_df",
+        "olofsson_df",
+    )
+
     def __init__(self, parameter_parser):
         super().__init__()
         self.stand_metadata_file = parameter_parser.stand_metadata_file
@@ -125,20 +168,22 @@ class AttributeAccuracyFormatter(ReportFormatter):
         self.riemann_dir = parameter_parser.riemann_output_folder
         self.k = parameter_parser.k
         self.image_files = []
+        self.image_dir = None
 
-        self.error_matrix_df = pd.read_csv(
-            parameter_parser.error_matrix_accuracy_file
-        )
-        self.bins_df = pd.read_csv(parameter_parser.error_matrix_bin_file)
-        self.area_df = pd.read_csv(parameter_parser.regional_accuracy_file)
-        self.olofsson_df = pd.read_csv(parameter_parser.regional_olofsson_file)
+        # These files are shared with the other accuracy formatter, so
+        # they are only read once
+        pp = parameter_parser
+        self.error_matrix_df = read_accuracy_file(pp.error_matrix_accuracy_file)
+        self.bins_df = read_accuracy_file(pp.error_matrix_bin_file)
+        self.area_df = read_accuracy_file(pp.regional_accuracy_file)
+        self.olofsson_df = read_accuracy_file(pp.regional_olofsson_file)
 
     def run_formatter(self):
         """
         Run formatter for all continuous attributes
         """
         # Read in the stand attribute metadata and get the continuous fields
-        metadata_parser = XMLStandMetadataParser(self.stand_metadata_file)
+        metadata_parser = get_stand_metadata_parser(self.stand_metadata_file)
         attrs = metadata_parser.filter(
             Flags.CONTINUOUS
             | Flags.ACCURACY
@@ -171,16 +216,21 @@ class AttributeAccuracyFormatter(ReportFormatter):
         )
 
         # Create the figures
-        local_figures = create_local_figures(merged_df, attrs)
+        self.image_dir = make_image_dir()
+        local_figures = create_local_figures(merged_df, attrs, self.image_dir)
         self.image_files.extend(local_figures)
 
+        # The paired local data is not needed for the remaining figures, so
+        # release it rather than holding it through the Riemann reads
+        del merged_df
+
         regional_figures = create_regional_figures(
-            self.area_df, self.olofsson_df, attrs
+            self.area_df, self.olofsson_df, attrs, self.image_dir
         )
         self.image_files.extend(regional_figures)
 
         riemann_figures = create_riemann_figures(
-            self.riemann_dir, self.k, attrs
+            self.riemann_dir, self.k, attrs, self.image_dir
         )
         self.image_files.extend(riemann_figures)
 
@@ -392,11 +442,10 @@ class AttributeAccuracyFormatter(ReportFormatter):
 
     def clean_up(self):
         """
-        Remove all image files
+        Remove all image files along with their directory
         """
-        for fn in self.image_files:
-            if os.path.exists(fn):
-                os.remove(fn)
+        if self.image_dir is not None:
+            shutil.rmtree(self.image_dir, ignore_errors=True)
 
     def build_flowable_page(self, attr):
         """
@@ -406,11 +455,11 @@ class AttributeAccuracyFormatter(ReportFormatter):
         error_matrix = self.build_error_matrix(attr)
 
         # Get the image files
-        scatter_fn = local_image_fn(attr)
-        regional_fn = regional_image_fn(attr)
-        riemann_10_fn = riemann_image_fn(attr, 10)
-        riemann_30_fn = riemann_image_fn(attr, 30)
-        riemann_50_fn = riemann_image_fn(attr, 50)
+        scatter_fn = local_image_fn(attr, self.image_dir)
+        regional_fn = regional_image_fn(attr, self.image_dir)
+        riemann_10_fn = riemann_image_fn(attr, 10, self.image_dir)
+        riemann_30_fn = riemann_image_fn(attr, 30, self.image_dir)
+        riemann_50_fn = riemann_image_fn(attr, 50, self.image_dir)
 
         title = attr.field_name + " (units: " + attr.units + ")"
         default_style = self.styles["body_11"]
@@ -1,7 +1,7 @@
 """
 Categorical accuracy formatter showing a subset of the information
 """
-import os
+import shutil
 from collections import defaultdict
 from copy import deepcopy
 
@@ -17,31 +17,19 @@ from reportlab.platypus import (
 )
 
 from pynnmap.misc.classification_accuracy import Classifier, Classification
-from pynnmap.parser.xml_stand_metadata_parser import (
-    Flags,
-    XMLStandMetadataParser,
-)
-
-from . import chart_func as cf
-from .report_formatter import ReportFormatter, page_break
-
+from pynnmap.parser.xml_stand_metadata_parser import Flags
 
-def regional_image_fn(attr):
-    """File name for regional accuracy histogram image"""
-    return f"{attr.field_name.lower()}_area.png"
-
-
-def create_regional_figures(area_df, olofsson_df, attrs):
-    """
-    Given a set of attributes and a dataframe of predicted and observed
-    area values, create a set of histograms and return the list of filenames
-    """
-    files = []
-    for attr in attrs:
-        fn = regional_image_fn(attr)
-        cf.draw_histogram(area_df, olofsson_df, attr, output_file=fn)
-        files.append(fn)
-    return files
+from .attribute_accuracy_formatter import (
+    create_regional_figures,
+    regional_image_fn,
+)
+from .report_formatter import (
+    ReportFormatter,
+    get_stand_metadata_parser,
+    make_image_dir,
+    page_break,
+    read_accuracy_file,
+)
 
 
 class CategoricalAccuracyFormatter(ReportFormatter):
@@ -50,6 +38,20 @@ class CategoricalAccuracyFormatter(ReportFormatter):
     graphic and error matrix for inclusion into a single page
     """
 
+    __slots__ = (
+        "stand_metadata_file",
+        "observed_file",
+        "predicted_file",
+        "id_field",
+        "k",
+        "image_files",
+        "image_dir",
+        "error_matrix_df",
+        "bins_df",
+        "area_df",
+        "olofsson_df",
+    )
+
     def __init__(self, parameter_parser):
         super().__init__()
         self.stand_metadata_file = parameter_parser.stand_metadata_file
@@ -58,13 +60,15 @@ class CategoricalAccuracyFormatter(ReportFormatter):
         self.id_field = parameter_parser.plot_id_field
         self.k = parameter_parser.k
         self.image_files = []
+        self.image_dir = None
 
-        self.error_matrix_df = pd.read_csv(
-            parameter_parser.error_matrix_accuracy_file
-        )
-        self.bins_df = pd.read_csv(parameter_parser.error_matrix_bin_file)
-        self.area_df = pd.read_csv(parameter_parser.regional_accuracy_file)
-        self.olofsson_df = pd.read_csv(parameter_parser.regional_olofsson_file)
+        # These files are shared with the other accuracy formatter, so
+        # they are only read once
+        pp = parameter_parser
+        self.error_matrix_df = read_accuracy_file(pp.error_matrix_accuracy_file)
+        self.bins_df = read_accuracy_file(pp.error_matrix_bin_file)
+        self.area_df = read_accuracy_file(pp.regional_accuracy_file)
+        self.olofsson_df = read_accuracy_file(pp.regional_olofsson_file)
 
         # TODO: Hack fix - there are a few pixels that have nearest neighbor
         #   of 0 (missing spatial data in one or more covariates).  This
@@ -78,7 +82,7 @@ class CategoricalAccuracyFormatter(ReportFormatter):
         Run formatter for all continuous attributes
         """
         # Read in the stand attribute metadata and get the continuous fields
-        metadata_parser = XMLStandMetadataParser(self.stand_metadata_file)
+        metadata_parser = get_stand_metadata_parser(self.stand_metadata_file)
         flags = Flags.CATEGORICAL | Flags.ACCURACY | Flags.PROJECT
         attrs = metadata_parser.filter(flags)
 
@@ -99,8 +103,9 @@ class CategoricalAccuracyFormatter(ReportFormatter):
         Create all figures in advance of building page.  Store all filenames
         in the image_files instance attribute.
         """
+        self.image_dir = make_image_dir()
         regional_figures = create_regional_figures(
-            self.area_df, self.olofsson_df, attrs
+            self.area_df, self.olofsson_df, attrs, self.image_dir
         )
         self.image_files.extend(regional_figures)
 
@@ -348,11 +353,10 @@ class CategoricalAccuracyFormatter(ReportFormatter):
 
     def clean_up(self):
         """
-        Remove all image files
+        Remove all image files along with their directory
         """
-        for fn in self.image_files:
-            if os.path.exists(fn):
-                os.remove(fn)
+        if self.image_dir is not None:
+            shutil.rmtree(self.image_dir, ignore_errors=True)
 
     def build_flowable_page(self, attr):
         """
@@ -362,16 +366,9 @@ class CategoricalAccuracyFormatter(ReportFormatter):
         error_matrix = self.build_error_matrix(attr)
 
         # Get the image files
-        regional_fn = regional_image_fn(attr)
+        regional_fn = regional_image_fn(attr, self.image_dir)
 
         title = attr.field_name + " (units: " + attr.units + ")"
-        table_style = [
-            ("LEFTPADDING", (0, 0), (0, 0), 0),
-            ("TOPPADDING", (0, 0), (-1, -1), 0),
-            ("RIGHTPADDING", (-1, -1), (-1, -1), 0),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
-            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-        ]
         default_style = self.styles["body_11"]
         title_style = self.styles["body_16"]
         subheading_style = self.styles["subheading"]
@@ -1,6 +1,8 @@
 """
 Chart classes for creating scatterplots and histograms
 """
+from collections import namedtuple
+
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
@@ -10,6 +12,9 @@ from scipy.stats import gaussian_kde
 from pynnmap.misc import statistics
 
 
+# Figures are only written to files, so always use the non-interactive
+# backend rather than probing for a display
+mpl.use("Agg")
 mpl.rcParams["font.family"] = "Open Sans"
 
 
@@ -27,8 +32,8 @@ class Scatterplot:
     """
 
     def __init__(self, x, y):
-        self.x = np.array(x)
-        self.y = np.array(y)
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
         self.min, self.max = get_global_limits(self.x, self.y)
 
     def __call__(self, **kwargs):
@@ -169,14 +174,32 @@ def draw_scatterplot(df, attr, output_file="foo.png", **kwargs):
     Render a scatterplot from LEMMA paired dataframe using the specified
     attribute
     """
-    # Extract the observed and predicted series from the data frame
+    # Extract the observed and predicted values from the data frame as
+    # arrays so that the index is not carried through the plotting calls
+    name = attr.field_name
+    obs = df[f"{name}_O"].to_numpy(copy=False)
+    prd = df[f"{name}_P"].to_numpy(copy=False)
+    draw_observed_predicted(obs, prd, attr, output_file=output_file, **kwargs)
+
+
+# Picklable stand-in for the attribute metadata needed to label a figure.
+# It lives here so that worker processes drawing figures only need to
+# import this module
+FigureAttribute = namedtuple("FigureAttribute", ["field_name", "units"])
+
+
+def draw_observed_predicted(obs, prd, attr, output_file="foo.png", **kwargs):
+    """
+    Render a scatterplot from arrays of observed and predicted values for
+    the specified attribute and return the output file name
+    """
     name, units = attr.field_name, attr.units
-    obs, prd = df[f"{name}_O"], df[f"{name}_P"]
     kwargs["xlabel"] = kwargs.get("xlabel", f"Predicted {name} ({units})")
     kwargs["ylabel"] = kwargs.get("ylabel", f"Observed {name} ({units})")
     ObservedPredictedScatterplot(obs, prd)(**kwargs)
     plt.draw()
     plt.savefig(output_file, edgecolor="k", dpi=250)
+    return output_file
 
 
 class Series:
@@ -348,16 +371,23 @@ class Histogram:
     """
     Simple histogram of multiple series using matplotlib.  This class is
     very opinionated about spacing, sizing, etc. and is likely only useful
-    for use in these accuracy assessment reports.
+    for use in these accuracy assessment reports.  An existing figure may
+    be passed in to be cleared and drawn on rather than creating a new one.
     """
 
-    def __init__(self, series_group, labels, x_title="X", y_title="Y"):
+    def __init__(
+        self, series_group, labels, x_title="X", y_title="Y", figure=None
+    ):
         self.series_group = series_group
         self.legend = Legend(series_group.names)
         self.labels = Labels(labels)
         self.x_title = x_title
         self.y_title = y_title
-        self.figure, self.axes = plt.subplots()
+        if figure is None:
+            self.figure, self.axes = plt.subplots()
+        else:
+            figure.clf()
+            self.figure, self.axes = figure, figure.add_subplot()
 
     def __call__(self):
         self._initialize_figure()
@@ -426,15 +456,19 @@ class Histogram:
         self.style_borders()
 
 
-def draw_histogram(area_df, olofsson_df, attr, output_file="foo.png"):
+def draw_histogram(
+    area_df, olofsson_df, attr, output_file="foo.png", figure=None
+):
     """
     Render a histogram from LEMMA paired dataframe using the specified
-    attribute
+    attribute.  If figure is given, it is reused and left open for the
+    caller to close
     """
     attr_df = area_df[area_df.VARIABLE == attr.field_name]
-    obs = attr_df[attr_df.DATASET == "OBSERVED"].AREA
-    prd = attr_df[attr_df.DATASET == "PREDICTED"].AREA
-    labels = attr_df[attr_df.DATASET == "OBSERVED"].BIN_NAME
+    obs_df = attr_df[attr_df.DATASET == "OBSERVED"]
+    obs = obs_df.AREA.to_numpy(copy=False)
+    prd = attr_df[attr_df.DATASET == "PREDICTED"].AREA.to_numpy(copy=False)
+    labels = obs_df.BIN_NAME.to_numpy(copy=False)
 
     adjusted_df = olofsson_df[olofsson_df.VARIABLE == attr.field_name]
     error_adjusted = np.hstack(([0.0, 0.0], adjusted_df.ADJUSTED))
@@ -450,8 +484,13 @@ def draw_histogram(area_df, olofsson_df, attr, output_file="foo.png"):
 
     # Create the figure
     x_title = f"{attr.field_name} ({attr.units})"
-    figure = Histogram(
-        series_group, labels, x_title=x_title, y_title="Area (ha)"
-    )()
-    figure.savefig(output_file, edgecolor="k", dpi=250)
-    plt.close(figure)
+    histogram = Histogram(
+        series_group,
+        labels,
+        x_title=x_title,
+        y_title="Area (ha)",
+        figure=figure,
+    )
+    histogram().savefig(output_file, edgecolor="k", dpi=250)
+    if figure is None:
+        plt.close(histogram.figure)
@@ -6,7 +6,25 @@ from reportlab.lib import units as u
 
 from pynnmap.parser import xml_stand_metadata_parser as xsmp
 
-from .report_formatter import ReportFormatter, page_break, txt_to_html
+from .report_formatter import (
+    ReportFormatter,
+    get_stand_metadata_parser,
+    page_break,
+    txt_to_html,
+)
+
+# Species summary text, completed with the units for each model type
+SPP_STR = """
+    Individual species codes are based on the <link color="#0000ff"
+    href="http://plants.usda.gov/">USDA PLANTS database</link> from
+    the year 2000, and values represent species
+"""
+SPP_SUFFIX = {
+    "sppsz": " basal area (m^2/ha).",
+    "sppba": " basal area (m^2/ha).",
+    "trecov": " percent cover.",
+    "wdycov": " percent cover.",
+}
 
 
 class DataDictionaryFormatter(ReportFormatter):
@@ -14,117 +32,95 @@ class DataDictionaryFormatter(ReportFormatter):
     Formatter for listing the attribute data dictionary
     """
 
+    __slots__ = (
+        "stand_metadata_file",
+        "model_type",
+        "spp_str",
+    )
+
     _required = ["stand_metadata_file"]
 
     def __init__(self, parameter_parser):
         super().__init__()
         self.stand_metadata_file = parameter_parser.stand_metadata_file
         self.model_type = parameter_parser.model_type
+        self.spp_str = SPP_STR + SPP_SUFFIX.get(self.model_type, "")
 
         self.check_missing_files()
 
-    def run_formatter(self):
+    def _build_dictionary_row(self, attr, body_style, code_style):
         """
-        Run formatter to create the data dictionary
+        Build the field name and description cells for a single attribute,
+        including a table of codes underneath the description if present
         """
-        # Set up an empty list to hold the story
-        story = []
+        field_para = p.Paragraph(attr.field_name, body_style)
+        description = (
+            f"{attr.description} ({attr.units})"
+            if attr.units != "none"
+            else attr.description
+        )
+        field_desc_para = p.Paragraph(description, body_style)
+
+        # If no codes exist, just add the field description
+        if not attr.codes:
+            return [field_para, field_desc_para]
+
+        # Build a row of code value and description for each code
+        code_table = [
+            [
+                p.Paragraph(code.code_value, code_style),
+                p.Paragraph(txt_to_html(code.description), code_style),
+            ]
+            for code in attr.codes
+        ]
+
+        # Convert this to a reportlab table
+        table = p.Table(code_table, colWidths=[0.75 * u.inch, 4.75 * u.inch])
+        table.setStyle(self.table_styles["code_table"])
+
+        # Stack the field description and field codes in the cell.  Table
+        # cells lay out a list of flowables directly, so no wrapper table is
+        # needed
+        return [field_para, [field_desc_para, p.Spacer(0, 12), table]]
 
+    def run_formatter(self):
+        """
+        Run formatter to create the data dictionary.  Flowables are yielded
+        as they are created rather than collected into a story list
+        """
         # Create a page break
-        story.extend(page_break(self.PORTRAIT))
+        yield from page_break(self.PORTRAIT)
 
         # Section title
         title = "Data Dictionary"
-        story.extend(self.create_section_title(title))
+        yield from self.create_section_title(title)
 
         # Read in the stand attribute metadata
-        metadata_parser = xsmp.XMLStandMetadataParser(self.stand_metadata_file)
+        metadata_parser = get_stand_metadata_parser(self.stand_metadata_file)
 
         # Subset the attributes to those that are accuracy attributes, are
         # identified to go into the report, and are not species variables
-        attrs = [
-            attr.field_name
-            for attr in metadata_parser.attributes
-            if (
-                attr.is_accuracy_attr() is True
-                and attr.is_project_attr() is True
-                and attr.is_species_attr() is False
-            )
-        ]
+        attrs = metadata_parser.filter(
+            xsmp.Flags.ACCURACY | xsmp.Flags.PROJECT | xsmp.Flags.NOT_SPECIES
+        )
 
-        # Set up the master dictionary table
-        dictionary_table = []
-
-        # Iterate through the attributes and print out the field information
-        # and codes if present
-        for attr in attrs:
-            metadata = metadata_parser.get_attribute(attr)
-            field_name = metadata.field_name
-            units = metadata.units
-            description = metadata.description
-
-            field_para = p.Paragraph(field_name, self.styles["body_9"])
-            if units != "none":
-                description += f" ({units})"
-            field_desc_para = p.Paragraph(description, self.styles["body_9"])
-
-            # If this field has codes, create a sub table underneath the
-            # field description
-            if metadata.codes:
-                # Set up a container to hold the code rows
-                code_table = []
-
-                # Iterate over all code rows and append to the code_table
-                for code in metadata.codes:
-                    code_para = p.Paragraph(
-                        code.code_value, self.styles["code_style"]
-                    )
-                    description = txt_to_html(code.description)
-                    code_desc_para = p.Paragraph(
-                        description, self.styles["code_style"]
-                    )
-                    code_table.append([code_para, code_desc_para])
-
-                # Convert this to a reportlab table
-                table = p.Table(
-                    code_table, colWidths=[0.75 * u.inch, 4.75 * u.inch]
-                )
-                table.setStyle(self.table_styles["code_table"])
-
-                # Create a stack of the field description and field codes
-                elements = [[field_desc_para], [table]]
-
-            # If no codes exist, just add the field description
-            else:
-                elements = [[field_desc_para]]
-
-            # Create a reportlab table of the field description and
-            # (if present) field codes
-            description_table = p.Table(elements, colWidths=[5.5 * u.inch])
-            description_table.setStyle(self.table_styles["description_table"])
-            dictionary_table.append([field_para, description_table])
+        # Build the master dictionary table with one row per attribute
+        body_style = self.styles["body_9"]
+        code_style = self.styles["code_style"]
+        dictionary_table = [
+            self._build_dictionary_row(attr, body_style, code_style)
+            for attr in attrs
+        ]
 
         # Format the dictionary table into a reportlab table
         table = p.Table(
             dictionary_table, colWidths=[1.85 * u.inch, 5.65 * u.inch]
         )
         table.setStyle(self.table_styles["data_dictionary"])
-        story.append(table)
+        yield table
 
         # Description of the species information that is attached to ArcInfo
         # grids.  We don't enumerate the codes here, but just give this
         # summary information
-        spp_str = """
-            Individual species codes are based on the <link color="#0000ff"
-            href="http://plants.usda.gov/">USDA PLANTS database</link> from
-            the year 2000, and values represent species
-        """
-        if self.model_type in ["sppsz", "sppba"]:
-            spp_str += " basal area (m^2/ha)."
-        elif self.model_type in ["trecov", "wdycov"]:
-            spp_str += " percent cover."
-
-        para = p.Paragraph(spp_str, self.styles["body_style"])
-        story.extend((p.Spacer(0, 0.1 * u.inch), para))
-        # Return this story
-        return story
+        yield p.Spacer(0, 0.1 * u.inch)
+        yield p.Paragraph(self.spp_str, self.styles["body_style"])
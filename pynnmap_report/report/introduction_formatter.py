@@ -1,18 +1,101 @@
 """
 Formatter for giving an introduction to the report
 """
-import itertools
-import locale
-from datetime import datetime
+from functools import lru_cache
+from html import escape
+from itertools import zip_longest
+from operator import attrgetter
 
 from reportlab import platypus as p
 from reportlab.lib import units as u
 
-from pynnmap.parser import xml_report_metadata_parser as xrmp
-
 from .. import LEMMA_LOGO
 from .config import GNN_RELEASE_VERSION
-from .report_formatter import ReportFormatter, page_break
+from .report_formatter import (
+    ReportFormatter,
+    cached_image,
+    get_report_metadata_parser,
+    page_break,
+    static_paragraph,
+)
+
+# Image sizes and table column widths
+LOGO_SIZE = (2.0 * u.inch, 1.96 * u.inch)
+REGION_IMAGE_SIZE = (3.0 * u.inch, 3.86 * u.inch)
+HEADING_COL_WIDTHS = (2.3 * u.inch, 5.2 * u.inch)
+PLOT_LISTING_COL_WIDTHS = (1.5 * u.inch, 4.2 * u.inch, 1.5 * u.inch)
+PREDICTOR_COL_WIDTHS = (1.0 * u.inch, 2.4 * u.inch, 3.8 * u.inch)
+
+# Spacers hold no layout state, so one instance is shared wherever it is
+# used
+SPACER_015 = p.Spacer(0, 0.15 * u.inch)
+SPACER_020 = p.Spacer(0, 0.2 * u.inch)
+SPACER_030 = p.Spacer(0, 0.3 * u.inch)
+
+# Static section text, built once at import rather than on each report
+WEBSITE_HTML = (
+    "<strong>LEMMA Website:</strong> "
+    '<link color="#0000ff" '
+    'href="https://lemma.forestry.oregonstate.edu/">'
+    "https://lemma.forestry.oregonstate.edu</link>"
+)
+DOWNLOAD_WEBSITE_HTML = (
+    "<strong>LEMMA Data Download Website:</strong> "
+    '<link color="#0000ff" '
+    'href="https://lemmadownload.forestry.oregonstate.edu/">'
+    "https://lemmadownload.forestry.oregonstate.edu</link>"
+)
+PLOT_MATCHING_TITLE = (
+    "<strong>Matching Plots to Imagery for Model Development:</strong>"
+)
+PLOT_MATCHING_TEXT = """
+    The current versions of the GNN maps were developed using
+    data from inventory plots that span a range of dates, and
+    from a yearly time-series of Landsat and Sentinel-2 imagery
+    mosaics from 1986 to 2021 developed using the Continuous Change
+    Detection and Classification (CCDC) algorithms (Zhu and
+    Woodcock, 2014). For model development, plots were matched
+    to spectral data for the same year as plot measurement.
+    See Ohmann et al. (2014) for more detailed information about
+    the GNN modeling process.
+"""
+MASK_TITLE = "<strong>Nonforest Mask Information:</strong>"
+MASK_TEXT = """
+    An important limitation of the GNN map products is the separation
+    of forest and nonforest lands. The GNN modeling applies to forest
+    areas only, where we have detailed field plot data. Nonforest
+    areas are 'masked' as such using an ancillary map. In California,
+    Oregon, Washington and parts of adjacent states, we are using
+    maps of Ecological Systems developed for the Gap Analysis
+    Program (GAP) as our nonforest mask. For our current GNN rasters,
+    nonforest pixels are designated by the value -1.
+
+    There are 'unmasked' versions of our GNN maps available upon
+    request, in case you have an alternative map of nonforest for
+    your area of interest that you would like to apply to the GNN maps.
+"""
+
+
+@lru_cache(maxsize=1)
+def thousands_separator():
+    """
+    Set the locale once for the process and return its thousands separator.
+    locale is imported here as it is only needed for model information
+    """
+    import locale  # pylint: disable=import-outside-toplevel
+
+    try:
+        locale.setlocale(locale.LC_ALL, "")
+    except locale.Error:
+        pass
+    return locale.localeconv()["thousands_sep"] or ","
+
+
+def format_int(value):
+    """
+    Format a number as an integer with thousands grouping
+    """
+    return f"{int(value):,}".replace(",", thousands_separator())
 
 
 class IntroductionFormatter(ReportFormatter):
@@ -20,18 +103,46 @@ class IntroductionFormatter(ReportFormatter):
     Formatter for giving an introduction to the report
     """
 
+    __slots__ = (
+        "report_metadata_file",
+        "model_region",
+        "model_type",
+        "model_year",
+        "report_date",
+        "body_style",
+        "heading_style",
+        "body_style_spaced",
+        "heading_style_spaced",
+        "title_style",
+        "sub_title_style",
+    )
+
     _required = ["report_metadata_file"]
 
     # Constants
     ACRES_PER_HECTARE = 2.471
 
-    def __init__(self, parameter_parser):
+    def __init__(self, parameter_parser, report_date):
         super().__init__()
         self.report_metadata_file = parameter_parser.report_metadata_file
         self.model_region = parameter_parser.model_region
         self.model_type = parameter_parser.model_type
         self.model_year = parameter_parser.model_year
 
+        # The report date is captured once by the report so that all
+        # sections agree
+        self.report_date = report_date
+
+        # Bind the frequently used paragraph styles once.  The spaced
+        # styles carry the 0.1" gap below a paragraph, so no Spacer
+        # flowable is needed
+        self.body_style = self.styles["body_style"]
+        self.heading_style = self.styles["heading_style"]
+        self.body_style_spaced = self.styles["body_style_spaced"]
+        self.heading_style_spaced = self.styles["heading_style_spaced"]
+        self.title_style = self.styles["title_style"]
+        self.sub_title_style = self.styles["sub_title_style"]
+
         self.check_missing_files()
 
     def report_heading(self, rmp):
@@ -48,40 +159,38 @@ class IntroductionFormatter(ReportFormatter):
             p.Table(
                 [
                     [
-                        p.Image(
-                            LEMMA_LOGO, 2.0 * u.inch, 1.96 * u.inch, mask="auto"
-                        ),
+                        cached_image(LEMMA_LOGO, *LOGO_SIZE, mask="auto"),
                         [
-                            p.Spacer(1, 0.2 * u.inch),
+                            SPACER_020,
                             p.Paragraph(
                                 "GNN Accuracy Assessment Report",
-                                self.styles["title_style"],
+                                self.title_style,
                             ),
                             p.Paragraph(
                                 (
                                     f"{rmp.model_region_name} (Modeling Region"
                                     f" {self.model_region})"
                                 ),
-                                self.styles["sub_title_style"],
+                                self.sub_title_style,
                             ),
                             p.Paragraph(
                                 (
                                     "Model Type:"
                                     f" {model_type_dict[self.model_type]}"
                                 ),
-                                self.styles["sub_title_style"],
+                                self.sub_title_style,
                             ),
                             p.Paragraph(
                                 f"Release Version: {GNN_RELEASE_VERSION}",
-                                self.styles["sub_title_style"],
+                                self.sub_title_style,
                             ),
                         ],
                     ]
                 ],
                 style=self.table_styles["dark_shaded"],
-                colWidths=[2.3 * u.inch, 5.2 * u.inch],
+                colWidths=HEADING_COL_WIDTHS,
             ),
-            p.Spacer(0.0, 0.3 * u.inch),
+            SPACER_030,
         ]
 
     def model_region_description(self, rmp):
@@ -90,19 +199,17 @@ class IntroductionFormatter(ReportFormatter):
         """
         return [
             p.ImageAndFlowables(
-                p.Image(
-                    rmp.image_path, 3.0 * u.inch, 3.86 * u.inch, mask="auto"
-                ),
+                cached_image(rmp.image_path, *REGION_IMAGE_SIZE, mask="auto"),
                 [
-                    p.Paragraph("Overview", self.styles["heading_style"]),
+                    static_paragraph("Overview", "heading_style"),
                     p.Paragraph(
-                        rmp.model_region_overview, self.styles["body_style"]
+                        rmp.model_region_overview, self.body_style
                     ),
                 ],
                 imageSide="left",
                 imageRightPadding=6,
             ),
-            p.Spacer(0.0, 0.2 * u.inch),
+            SPACER_020,
         ]
 
     def contact_information(self, rmp):
@@ -110,40 +217,40 @@ class IntroductionFormatter(ReportFormatter):
         Table of contact information for LEMMA team
         """
 
+        contact_style = self.styles["body_style_9"]
+
         def _contact_cell(_contact):
-            contact_str = """
-                <b>{name}</b><br/>
-                {position}<br/>
-                {affiliation}<br/>
-                Phone: {phone}<br/>
-                Email: {email}
-            """
+            # Escape the metadata fields so that characters such as "&"
+            # are not read as paragraph markup
+            name, position, affiliation, phone, email = (
+                escape(str(field), quote=False)
+                for field in (
+                    _contact.name,
+                    _contact.position_title,
+                    _contact.affiliation,
+                    _contact.phone_number,
+                    _contact.email_address,
+                )
+            )
             return p.Paragraph(
-                contact_str.format(
-                    name=_contact.name,
-                    position=_contact.position_title,
-                    affiliation=_contact.affiliation,
-                    phone=_contact.phone_number,
-                    email=_contact.email_address,
-                ),
-                self.styles["body_style_9"],
+                f"<b>{name}</b><br/>{position}<br/>{affiliation}<br/>"
+                f"Phone: {phone}<br/>Email: {email}",
+                contact_style,
             )
 
-        contact_table = []
-        contact_row = []
-        table_cols = min(3, len(rmp.contacts))
-        for i, contact in enumerate(rmp.contacts):
-            contact_row.append(_contact_cell(contact))
-            if i % table_cols == table_cols - 1:
-                contact_table.append(contact_row)
-                contact_row = []
+        # Group the contacts into rows, padding the final partial row
+        cells = [_contact_cell(contact) for contact in rmp.contacts]
+        table_cols = min(3, len(cells))
+        contact_table = [
+            list(row)
+            for row in zip_longest(*[iter(cells)] * table_cols, fillvalue="")
+        ]
         table = p.Table(contact_table)
         table.setStyle(self.table_styles["contacts"])
         return [
-            p.Paragraph("Contact Information:", self.styles["heading_style"]),
-            p.Spacer(0.0, 0.1 * u.inch),
+            p.Paragraph("Contact Information:", self.heading_style_spaced),
             table,
-            p.Spacer(0, 0.15 * u.inch),
+            SPACER_015,
         ]
 
     def website_information(self):
@@ -151,54 +258,33 @@ class IntroductionFormatter(ReportFormatter):
         Website addresses and link
         """
         return [
-            p.Paragraph(
-                (
-                    "<strong>LEMMA Website:</strong> "
-                    '<link color="#0000ff" '
-                    'href="https://lemma.forestry.oregonstate.edu/">'
-                    "https://lemma.forestry.oregonstate.edu</link>"
-                ),
-                self.styles["body_style"],
-            ),
-            p.Paragraph(
-                (
-                    "<strong>LEMMA Data Download Website:</strong> "
-                    '<link color="#0000ff" '
-                    'href="https://lemmadownload.forestry.oregonstate.edu/">'
-                    "https://lemmadownload.forestry.oregonstate.edu</link>"
-                ),
-                self.styles["body_style"],
-            ),
+            static_paragraph(WEBSITE_HTML, "body_style"),
+            static_paragraph(DOWNLOAD_WEBSITE_HTML, "body_style"),
         ]
 
     def model_information(self, rmp):
         """
         General model information
         """
-        time_str = (
-            "<strong>Report Date:</strong>"
-            f' {datetime.now().strftime("%Y.%m.%d")}'
-        )
+        time_str = f"<strong>Report Date:</strong> {self.report_date}"
 
         # Model region area
-        locale.setlocale(locale.LC_ALL, "")
         mr_area_ha = rmp.model_region_area
         mr_area_ac = mr_area_ha * self.ACRES_PER_HECTARE
         mr_area_str = (
             "<strong>Model Region Area:</strong>"
-            f' {locale.format("%d", mr_area_ha, True)} hectares'
-            f' ({locale.format("%d", mr_area_ac, True)} acres)'
+            f" {format_int(mr_area_ha)} hectares"
+            f" ({format_int(mr_area_ac)} acres)"
         )
 
         # Forest area
         forest_area_ha = rmp.forest_area
         forest_area_ac = forest_area_ha * self.ACRES_PER_HECTARE
+        forest_area_pct = forest_area_ha / mr_area_ha * 100.0
         forest_area_str = (
-            "<strong>Forest Area:</strong> {} hectares ({} acres) - {:.1f}%"
-        ).format(
-            locale.format("%d", forest_area_ha, True),
-            locale.format("%d", forest_area_ac, True),
-            forest_area_ha / mr_area_ha * 100.0,
+            "<strong>Forest Area:</strong>"
+            f" {format_int(forest_area_ha)} hectares"
+            f" ({format_int(forest_area_ac)} acres) - {forest_area_pct:.1f}%"
         )
 
         # Model imagery date
@@ -207,178 +293,121 @@ class IntroductionFormatter(ReportFormatter):
         )
 
         return [
-            p.Paragraph("General Information", self.styles["heading_style"]),
-            p.Spacer(0, 0.1 * u.inch),
-            p.Paragraph(time_str, self.styles["body_style"]),
-            p.Spacer(0, 0.1 * u.inch),
-            p.Paragraph(mr_area_str, self.styles["body_style"]),
-            p.Spacer(0, 0.1 * u.inch),
-            p.Paragraph(forest_area_str, self.styles["body_style"]),
-            p.Spacer(0, 0.1 * u.inch),
-            p.Paragraph(mr_imagery_str, self.styles["body_style"]),
-            p.Spacer(0, 0.1 * u.inch),
+            p.Paragraph("General Information", self.heading_style_spaced),
+            p.Paragraph(time_str, self.body_style_spaced),
+            p.Paragraph(mr_area_str, self.body_style_spaced),
+            p.Paragraph(forest_area_str, self.body_style_spaced),
+            p.Paragraph(mr_imagery_str, self.body_style_spaced),
         ]
 
     def plot_matching(self):
         """
         Matching plots to imagery section
         """
-        plot_title = """
-            <strong>Matching Plots to Imagery for Model Development:</strong>
-        """
-        imagery_str = """
-            The current versions of the GNN maps were developed using
-            data from inventory plots that span a range of dates, and
-            from a yearly time-series of Landsat and Sentinel-2 imagery
-            mosaics from 1986 to 2021 developed using the Continuous Change
-            Detection and Classification (CCDC) algorithms (Zhu and
-            Woodcock, 2014). For model development, plots were matched
-            to spectral data for the same year as plot measurement.
-            See Ohmann et al. (2014) for more detailed information about
-            the GNN modeling process.
-        """
         return [
-            p.Paragraph(plot_title, self.styles["body_style"]),
-            p.Spacer(0, 0.1 * u.inch),
-            p.Paragraph(imagery_str, self.styles["body_style"]),
-            p.Spacer(0, 0.10 * u.inch),
+            static_paragraph(PLOT_MATCHING_TITLE, "body_style_spaced"),
+            static_paragraph(PLOT_MATCHING_TEXT, "body_style_spaced"),
         ]
 
     def mask_information(self):
         """
         Nonforest mask section
         """
-        mask_str = """
-            An important limitation of the GNN map products is the separation
-            of forest and nonforest lands. The GNN modeling applies to forest
-            areas only, where we have detailed field plot data. Nonforest
-            areas are 'masked' as such using an ancillary map. In California,
-            Oregon, Washington and parts of adjacent states, we are using
-            maps of Ecological Systems developed for the Gap Analysis
-            Program (GAP) as our nonforest mask. For our current GNN rasters,
-            nonforest pixels are designated by the value -1.
-            
-            There are 'unmasked' versions of our GNN maps available upon
-            request, in case you have an alternative map of nonforest for
-            your area of interest that you would like to apply to the GNN maps.
-        """
         return [
-            p.Paragraph(
-                "<strong>Nonforest Mask Information:</strong>",
-                self.styles["body_style"],
-            ),
-            p.Spacer(0, 0.1 * u.inch),
-            p.Paragraph(mask_str, self.styles["body_style"]),
-            p.Spacer(0, 0.1 * u.inch),
+            static_paragraph(MASK_TITLE, "body_style_spaced"),
+            static_paragraph(MASK_TEXT, "body_style_spaced"),
         ]
 
-    def _build_year_count_row(self, year):
-        return (
-            year.plot_count,
-            [
-                p.Paragraph(
-                    year.assessment_year, self.styles["contact_style_right"]
-                ),
-                p.Paragraph(
-                    str(year.plot_count), self.styles["contact_style_right"]
-                ),
-            ],
-        )
-
-    def _build_data_source_row(self, source):
-        plot_count_table = []
-        plot_count = 0
-        for year in source.assessment_years:
-            count, flowable = self._build_year_count_row(year)
-            plot_count += count
-            plot_count_table.append(flowable)
-
-        table = p.Table(plot_count_table)
-        table.setStyle(self.table_styles["default_shaded"])
-
-        return (
-            plot_count,
-            [
-                p.Paragraph(source.data_source, self.styles["contact_style"]),
-                p.Paragraph(source.description, self.styles["contact_style"]),
-                table,
-            ],
+    @staticmethod
+    def _build_data_source_row(source, left_style, right_style):
+        # List the plot count for each year in a single paragraph rather
+        # than a nested table, which is much cheaper to lay out
+        years = source.assessment_years
+        year_counts = "<br/>".join(
+            f"{year.assessment_year}: {year.plot_count}" for year in years
         )
+        return sum(map(attrgetter("plot_count"), years)), [
+            p.Paragraph(source.data_source, left_style),
+            p.Paragraph(source.description, left_style),
+            p.Paragraph(year_counts, right_style),
+        ]
 
-    def _build_long_data_source_row(self, source):
-        years = (x.assessment_year for x in source.assessment_years)
-        count = sum(x.plot_count for x in source.assessment_years)
+    @staticmethod
+    def _build_long_data_source_row(source, left_style, right_style):
+        # Find the year range and total plot count in a single pass
+        years = source.assessment_years
+        min_year = max_year = years[0].assessment_year
+        count = 0
+        for year in years:
+            assessment_year = year.assessment_year
+            if assessment_year < min_year:
+                min_year = assessment_year
+            elif assessment_year > max_year:
+                max_year = assessment_year
+            count += year.plot_count
         return count, [
-            p.Paragraph(source.data_source, self.styles["contact_style"]),
-            p.Paragraph(source.description, self.styles["contact_style"]),
-            p.Paragraph(
-                f"{min(years)}-{max(years)}: {count}",
-                self.styles["contact_style_right"],
-            ),
+            p.Paragraph(source.data_source, left_style),
+            p.Paragraph(source.description, left_style),
+            p.Paragraph(f"{min_year}-{max_year}: {count}", right_style),
         ]
 
     def plots_by_date(self, rmp):
         """
         Build table of model plots by data source and year
         """
+        left_style = self.styles["contact_style"]
+        right_style = self.styles["contact_style_right"]
+
         # Header row
         plot_table = [
             [
-                p.Paragraph(
-                    "<strong>Data Source</strong>", self.styles["contact_style"]
-                ),
-                p.Paragraph(
-                    "<strong>Description</strong>", self.styles["contact_style"]
-                ),
-                p.Paragraph(
-                    "<strong>Plot Count by Year</strong>",
-                    self.styles["contact_style"],
-                ),
+                p.Paragraph("<strong>Data Source</strong>", left_style),
+                p.Paragraph("<strong>Description</strong>", left_style),
+                p.Paragraph("<strong>Plot Count by Year</strong>", left_style),
             ]
         ]
 
-        # Data source rows
-        total_plots = 0
-        for source in rmp.plot_data_sources:
-            if len(source.assessment_years) > 30:
-                ds_count, flowable = self._build_long_data_source_row(source)
-            else:
-                ds_count, flowable = self._build_data_source_row(source)
-            total_plots += ds_count
-            plot_table.append(flowable)
+        # Data source rows.  Sources with many years are summarized by
+        # their year range
+        rows = [
+            (
+                self._build_long_data_source_row
+                if len(source.assessment_years) > 30
+                else self._build_data_source_row
+            )(source, left_style, right_style)
+            for source in rmp.plot_data_sources
+        ]
+        ds_counts, flowables = zip(*rows) if rows else ((), ())
+        plot_table.extend(flowables)
+        total_plots = sum(ds_counts)
 
         # Summary row
+        bold_style = self.styles["contact_style_right_bold"]
         plot_table.append(
             [
                 "",
-                p.Paragraph(
-                    "Total Plots", self.styles["contact_style_right_bold"]
-                ),
-                p.Paragraph(
-                    str(total_plots), self.styles["contact_style_right_bold"]
-                ),
+                p.Paragraph("Total Plots", bold_style),
+                p.Paragraph(str(total_plots), bold_style),
             ]
         )
 
-        table = p.Table(
-            plot_table, colWidths=[1.5 * u.inch, 4.2 * u.inch, 1.5 * u.inch]
-        )
+        table = p.Table(plot_table, colWidths=PLOT_LISTING_COL_WIDTHS)
         table.hAlign = "LEFT"
         table.setStyle(self.table_styles["plot_listing"])
         return [
             p.Paragraph(
                 "<strong>Inventory Plots in Model Development</strong>",
-                self.styles["heading_style"],
+                self.heading_style_spaced,
             ),
-            p.Spacer(0, 0.10 * u.inch),
             table,
         ]
 
-    def _build_spatial_predictor_row(self, predictor):
+    @staticmethod
+    def _build_spatial_predictor_row(predictor, style):
         return [
-            p.Paragraph(predictor.field_name, self.styles["contact_style"]),
-            p.Paragraph(predictor.description, self.styles["contact_style"]),
-            p.Paragraph(predictor.source, self.styles["contact_style"]),
+            p.Paragraph(predictor.field_name, style),
+            p.Paragraph(predictor.description, style),
+            p.Paragraph(predictor.source, style),
         ]
 
     def spatial_predictors(self, rmp):
@@ -390,63 +419,51 @@ class IntroductionFormatter(ReportFormatter):
             (GIS/remote sensing) variables that were used in creating
             this model.
         """
+        style = self.styles["contact_style"]
 
         # Header row
         ordination_table = [
             [
-                p.Paragraph(
-                    "<strong>Variable</strong>", self.styles["contact_style"]
-                ),
-                p.Paragraph(
-                    "<strong>Description</strong>", self.styles["contact_style"]
-                ),
-                p.Paragraph(
-                    "<strong>Data Source</strong>", self.styles["contact_style"]
-                ),
+                p.Paragraph("<strong>Variable</strong>", style),
+                p.Paragraph("<strong>Description</strong>", style),
+                p.Paragraph("<strong>Data Source</strong>", style),
             ],
         ]
 
         # Data rows
         for predictor in rmp.ordination_variables:
-            flowable = self._build_spatial_predictor_row(predictor)
+            flowable = self._build_spatial_predictor_row(predictor, style)
             ordination_table.append(flowable)
 
-        table = p.Table(
-            ordination_table,
-            colWidths=[1.0 * u.inch, 2.4 * u.inch, 3.8 * u.inch],
-        )
+        table = p.Table(ordination_table, colWidths=PREDICTOR_COL_WIDTHS)
         table.hAlign = "LEFT"
         table.setStyle(self.table_styles["default_shaded"])
         return [
             p.Paragraph(
                 "Spatial Predictor Variables in Model Development",
-                self.styles["heading_style"],
+                self.heading_style_spaced,
             ),
-            p.Spacer(0, 0.10 * u.inch),
-            p.Paragraph(ord_var_str, self.styles["body_style"]),
-            p.Spacer(0, 0.1 * u.inch),
+            p.Paragraph(ord_var_str, self.body_style_spaced),
             table,
         ]
 
     def run_formatter(self):
         """
-        Run formatter for the introduction
+        Run formatter for the introduction.  Flowables are yielded section
+        by section rather than collected into a story list
         """
         # Report metadata
-        rmp = xrmp.XMLReportMetadataParser(self.report_metadata_file)
-
-        story = [
-            self.report_heading(rmp),
-            self.model_region_description(rmp),
-            self.contact_information(rmp),
-            self.website_information(),
-            page_break(self.PORTRAIT),
-            self.model_information(rmp),
-            self.plot_matching(),
-            self.mask_information(),
-            page_break(self.PORTRAIT),
-            self.plots_by_date(rmp),
-            page_break(self.PORTRAIT),
-            self.spatial_predictors(rmp),
-        ]
-        return list(itertools.chain.from_iterable(story))
+        rmp = get_report_metadata_parser(self.report_metadata_file)
+
+        yield from self.report_heading(rmp)
+        yield from self.model_region_description(rmp)
+        yield from self.contact_information(rmp)
+        yield from self.website_information()
+        yield from page_break(self.PORTRAIT)
+        yield from self.model_information(rmp)
+        yield from self.plot_matching()
+        yield from self.mask_information()
+        yield from page_break(self.PORTRAIT)
+        yield from self.plots_by_date(rmp)
+        yield from page_break(self.PORTRAIT)
+        yield from self.spatial_predictors(rmp)
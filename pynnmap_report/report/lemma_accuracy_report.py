@@ -1,6 +1,9 @@
 """
 LEMMA GNN accuracy report with one page per attribute
 """
+from datetime import date
+from itertools import chain
+
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame
@@ -17,30 +20,62 @@ from .references_formatter import ReferencesFormatter
 
 
 class PageNumCanvas(Canvas):
-    def __init__(self, *args, **kwargs):
-        Canvas.__init__(self, *args, **kwargs)
-        self.pages = []
+    """
+    Canvas that writes the release and "Page X of Y" footer on each page.
+    Each page refers to a small form for its page number, and the forms
+    are only drawn once the total page count is known on save.  This
+    keeps the pages streaming to the document rather than holding a copy
+    of the canvas state for every page
+    """
 
     def showPage(self):
-        self.pages.append(dict(self.__dict__))
-        self._startPage()
+        self.draw_page_footer()
+        super().showPage()
 
     def save(self):
-        page_count = len(self.pages)
-        for page in self.pages:
-            self.__dict__.update(page)
-            self.draw_page_number(page_count)
-            super().showPage()
+        # Finish any page still in progress before counting pages
+        if self._code:
+            self.showPage()
+        page_count = self.getPageNumber() - 1
+        for page_number in range(1, page_count + 1):
+            self.beginForm(f"page_number_{page_number}")
+            self.draw_page_number(page_number, page_count)
+            self.endForm()
         super().save()
 
-    def draw_page_number(self, page_count):
-        page = f"Page {self._pageNumber} of {page_count}"
-        self.setFont(FONTS["Open-Sans"]["regular"], 9)
+    def draw_page_footer(self):
         release = f"LEMMA GNN Release {GNN_RELEASE_VERSION}"
+        self.setFont(FONTS["Open-Sans"]["regular"], 9)
         self.drawString(0.5 * inch, 0.25 * inch, release)
+        self.doForm(f"page_number_{self.getPageNumber()}")
+
+    def draw_page_number(self, page_number, page_count):
+        page = f"Page {page_number} of {page_count}"
+        self.setFont(FONTS["Open-Sans"]["regular"], 9)
         self.drawRightString(8.0 * inch, 0.25 * inch, page)
 
 
+# Portrait page frame position and size, and its (zero) padding
+PORTRAIT_FRAME_ARGS = (0.5 * inch, 0.5 * inch, 7.5 * inch, 10.2 * inch)
+FRAME_PADDING = {
+    "leftPadding": 0,
+    "bottomPadding": 0,
+    "rightPadding": 0,
+    "topPadding": 0,
+}
+
+
+def make_doc(report_file):
+    """
+    Create the document template for a report.  Frames hold layout state
+    while a document is built, so new ones are created for each document
+    """
+    doc = BaseDocTemplate(report_file, pagesize=letter)
+    frame = Frame(*PORTRAIT_FRAME_ARGS, id=None, **FRAME_PADDING)
+    doc.addPageTemplates([PageTemplate(id="portrait", frames=[frame])])
+    return doc
+
+
 class LemmaAccuracyReport:
     """
     LEMMA GNN accuracy report with one page per attribute
@@ -48,7 +83,9 @@ class LemmaAccuracyReport:
 
     def __init__(self, parameter_parser):
         self.parameter_parser = parameter_parser
-        self.story = []
+
+        # Capture the report date once so all sections agree
+        self.report_date = date.today().strftime("%Y.%m.%d")
 
     def create_accuracy_report(self):
         """
@@ -57,50 +94,26 @@ class LemmaAccuracyReport:
         parser = self.parameter_parser
 
         # Set up the document template
-        doc = BaseDocTemplate(
-            parser.accuracy_assessment_report, pagesize=letter
-        )
-
-        # Add the page template
-        doc.addPageTemplates(
-            [
-                PageTemplate(
-                    id="portrait",
-                    frames=[
-                        Frame(
-                            0.5 * inch,
-                            0.5 * inch,
-                            7.5 * inch,
-                            10.2 * inch,
-                            leftPadding=0,
-                            bottomPadding=0,
-                            rightPadding=0,
-                            topPadding=0,
-                            id=None,
-                        ),
-                    ],
-                ),
-            ]
-        )
+        doc = make_doc(parser.accuracy_assessment_report)
 
         # Make a list of formatters which are separate subsections of the
         # report
         formatters = [
-            IntroductionFormatter(self.parameter_parser),
+            IntroductionFormatter(self.parameter_parser, self.report_date),
             AttributeAccuracyFormatter(self.parameter_parser),
             CategoricalAccuracyFormatter(self.parameter_parser),
             SpeciesAccuracyFormatter(self.parameter_parser),
             DataDictionaryFormatter(self.parameter_parser),
             ReferencesFormatter(),
         ]
-        for formatter in formatters:
-            sub_story = formatter.run_formatter()
-            if sub_story is not None:
-                self.story.extend(sub_story[:])
-                del sub_story
+        # Chain the sub-stories into a single story, which is only
+        # materialized when the document is built
+        story = chain.from_iterable(
+            formatter.run_formatter() or () for formatter in formatters
+        )
 
         # Write out the story
-        doc.build(self.story, canvasmaker=PageNumCanvas)
+        doc.build(list(story), canvasmaker=PageNumCanvas)
 
         # Clean up if necessary for each formatter
         for formatter in formatters:
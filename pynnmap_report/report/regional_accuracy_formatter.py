@@ -6,9 +6,44 @@ from reportlab import platypus as p
 from reportlab.lib import units as u
 
 from pynnmap_report.report import report_formatter
-from pynnmap_report.report import report_styles
 from pynnmap.misc import mpl_figures as mplf
-from pynnmap.parser import xml_stand_metadata_parser as xsmp
+from pynnmap.parser.xml_stand_metadata_parser import Flags
+
+# Explanation of the regional histograms
+HISTOGRAM_TEXT = """
+    These histograms compare the distributions of land area in
+    different vegetation conditions as estimated from a regional,
+    sample- (plot-) based inventory (FIA Annual Plots) to model
+    predictions from GNN (based on counts of 30-m pixels).
+    <br/><br/>
+
+    For the FIA annual plots, the distributions of forest area
+    are determined by summing the 'area expansion factors' at the
+    plot condition-class level. The plot-based estimates are
+    subject to sampling error, but this is not shown in the graphs
+    due to complexities involved.  For more information about the
+    FIA Annual inventory sample design, see the
+    <link href="http://fia.fs.fed.us/library/database-documentation"
+    color="blue">FIADB Users Manual</link>.
+    <br/><br/>
+
+    Some plots were not visited on the ground due to denied
+    access or hazardous conditions, so the area these plots
+    represent cannot be characterized and is included in the bar
+    labeled 'unsampled.'
+    <br/><br/>
+
+    The bars labeled 'nonforest' also require explanation. For GNN,
+    this is the area of nonforest in the map, which is derived
+    from ancillary (non-GNN) spatial data sources such as the
+    National Land Cover Data (NLCD) or Ecological Systems maps
+    from the Gap Analysis Program (GAP). This mapped nonforest is
+    referred to as the GNN 'nonforest mask.'
+    <br/><br/>
+
+    For the plots, the 'nonforest' bar represents the nonforest area
+    as estimated from the FIA Annual sample.
+"""
 
 
 class RegionalAccuracyFormatter(report_formatter.ReportFormatter):
@@ -38,48 +73,58 @@ class RegionalAccuracyFormatter(report_formatter.ReportFormatter):
     def clean_up(self):
         # Remove the histograms
         for fn in self.histogram_files:
-            if os.path.exists(fn):
+            try:
                 os.remove(fn)
+            except FileNotFoundError:
+                pass
 
     def _create_histograms(self):
-        # Open the area estimate file into a recarray
-        ae_data = pd.read_csv(self.regional_accuracy_file)
+        # Open the area estimate file into a data frame, keeping only the
+        # columns used for the histograms.  The attribute and dataset names
+        # repeat on every row, so store them as categories
+        ae_data = pd.read_csv(
+            self.regional_accuracy_file,
+            usecols=["VARIABLE", "DATASET", "BIN_NAME", "AREA"],
+            dtype={"VARIABLE": "category", "DATASET": "category"},
+        )
 
         # Read in the stand attribute metadata
-        mp = xsmp.XMLStandMetadataParser(self.stand_metadata_file)
+        mp = report_formatter.get_stand_metadata_parser(
+            self.stand_metadata_file
+        )
 
         # Subset the attributes to those that are accuracy attributes,
         # are identified to go into the report, and are not species variables
-        attrs = [
-            attr.field_name
-            for attr in mp.attributes
-            if (
-                attr.is_accuracy_attr()
-                and attr.is_project_attr()
-                and not attr.is_species_attr()
-            )
-        ]
+        attrs = mp.filter(Flags.ACCURACY | Flags.PROJECT | Flags.NOT_SPECIES)
+
+        # Group the area estimates by attribute and dataset once, rather
+        # than scanning the whole table for every attribute
+        grouped = ae_data.groupby(
+            ["VARIABLE", "DATASET"], observed=True, sort=False
+        )
+        groups = dict(iter(grouped))
+        empty = ae_data.iloc[0:0]
 
         # Iterate over the attributes and create a histogram file of each
         histogram_files = []
-        for attr in attrs:
-            # Metadata for this attribute
-            metadata = mp.get_attribute(attr)
+        for metadata in attrs:
+            attr = metadata.field_name
 
             # Get the observed and predicted data for this attribute
-            obs_vals = self._get_histogram_data(ae_data, attr, "OBSERVED")
-            prd_vals = self._get_histogram_data(ae_data, attr, "PREDICTED")
+            obs_vals = groups.get((attr, "OBSERVED"), empty)
+            prd_vals = groups.get((attr, "PREDICTED"), empty)
 
             if len(obs_vals) == 0:
                 continue
 
             # Set the areas for the observed and predicted data
-            obs_area = obs_vals.AREA
-            prd_area = prd_vals.AREA
+            obs_area = obs_vals.AREA.to_numpy(copy=False)
+            prd_area = prd_vals.AREA.to_numpy(copy=False)
 
             # Set the bin names (same for both observed and predicted series)
-            bin_names = obs_vals.BIN_NAME
-            if not np.array_equal(bin_names.values, prd_vals.BIN_NAME.values):
+            bin_names = obs_vals.BIN_NAME.to_numpy(copy=False)
+            prd_names = prd_vals.BIN_NAME.to_numpy(copy=False)
+            if not np.array_equal(bin_names, prd_names):
                 err_msg = "Bin names are not the same for " + attr
                 raise ValueError(err_msg)
 
@@ -101,18 +146,10 @@ class RegionalAccuracyFormatter(report_formatter.ReportFormatter):
         # Return the list of histograms just created
         return histogram_files
 
-    @staticmethod
-    def _get_histogram_data(ae_data, attr, dataset):
-        conds = (ae_data.VARIABLE == attr) & (ae_data.DATASET == dataset)
-        return ae_data[conds]
-
     def _create_story(self, histogram_files):
         # Set up an empty list to hold the story
         story = []
 
-        # Import the report styles
-        styles = report_styles.get_report_styles()
-
         # Create a page break
         story = self._make_page_break(story, self.PORTRAIT)
 
@@ -124,41 +161,9 @@ class RegionalAccuracyFormatter(report_formatter.ReportFormatter):
         story.extend((self._make_title(title_str), p.Spacer(0, 0.20 * u.inch)))
 
         # Histogram explanation
-        histo_str = """
-            These histograms compare the distributions of land area in
-            different vegetation conditions as estimated from a regional,
-            sample- (plot-) based inventory (FIA Annual Plots) to model
-            predictions from GNN (based on counts of 30-m pixels).
-            <br/><br/>
-
-            For the FIA annual plots, the distributions of forest area
-            are determined by summing the 'area expansion factors' at the
-            plot condition-class level. The plot-based estimates are
-            subject to sampling error, but this is not shown in the graphs
-            due to complexities involved.  For more information about the
-            FIA Annual inventory sample design, see the
-            <link href="http://fia.fs.fed.us/library/database-documentation"
-            color="blue">FIADB Users Manual</link>.
-            <br/><br/>
-
-            Some plots were not visited on the ground due to denied
-            access or hazardous conditions, so the area these plots
-            represent cannot be characterized and is included in the bar
-            labeled 'unsampled.'
-            <br/><br/>
-
-            The bars labeled 'nonforest' also require explanation. For GNN,
-            this is the area of nonforest in the map, which is derived
-            from ancillary (non-GNN) spatial data sources such as the
-            National Land Cover Data (NLCD) or Ecological Systems maps
-            from the Gap Analysis Program (GAP). This mapped nonforest is
-            referred to as the GNN 'nonforest mask.'
-            <br/><br/>
-
-            For the plots, the 'nonforest' bar represents the nonforest area
-            as estimated from the FIA Annual sample.
-        """
-        story.append(p.Paragraph(histo_str, styles["body_style"]))
+        story.append(
+            report_formatter.static_paragraph(HISTOGRAM_TEXT, "body_style")
+        )
         story.append(p.Spacer(0, 0.1 * u.inch))
 
         # Create a table of histograms and add to story
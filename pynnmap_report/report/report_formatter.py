@@ -1,19 +1,31 @@
 """
 Definition of formatter base class
 """
-import re
-
+import copy
+import io
+import os
+import tempfile
+from functools import lru_cache
+from itertools import zip_longest
+
+import pandas as pd
 from reportlab import platypus as p
 from reportlab.lib import colors
 from reportlab.lib import units as u
 
 from pynnmap.misc import utilities
+from pynnmap.parser.xml_report_metadata_parser import XMLReportMetadataParser
+from pynnmap.parser.xml_stand_metadata_parser import XMLStandMetadataParser
 
 from .styles.paragraph_styles import get_paragraph_styles
 from .styles.table_styles import get_table_styles
 
 
 STYLES = get_paragraph_styles("Open-Sans")
+TABLE_STYLES = get_table_styles()
+
+# Characters in plain text that need replacing for reportlab markup
+HTML_TRANSLATION = str.maketrans({">": "&gt;", "<": "&lt;", "\n": "<br/>"})
 
 
 def page_break(orientation):
@@ -26,53 +38,141 @@ def page_break(orientation):
     ]
 
 
+@lru_cache(maxsize=32)
+def _read_image_bytes(image_file, _mtime):
+    """
+    Read the raw bytes of an image file.  _mtime is only used as part of
+    the cache key so that a changed file is read again
+    """
+    with open(image_file, "rb") as fh:
+        return fh.read()
+
+
+def read_image_bytes(image_file):
+    """
+    Read the raw bytes of an image file, caching them so that repeated
+    images (e.g. the LEMMA logo) are only read from disk once
+    """
+    mtime = os.path.getmtime(image_file)
+    return _read_image_bytes(image_file, mtime)
+
+
+def cached_image(image_file, width, height, **kwargs):
+    """
+    Create an image flowable from cached image bytes.  Flowables hold
+    drawing state, so a new one is created on each call
+    """
+    return p.Image(
+        io.BytesIO(read_image_bytes(image_file)), width, height, **kwargs
+    )
+
+
+@lru_cache(maxsize=None)
+def _parse_static_paragraph(text, style_name):
+    return p.Paragraph(text, STYLES[style_name])
+
+
+def static_paragraph(text, style_name):
+    """
+    Create a paragraph for constant text.  The markup is parsed once and
+    a shallow copy is returned on each call, as paragraphs hold layout
+    state during the build
+    """
+    return copy.copy(_parse_static_paragraph(text, style_name))
+
+
+def make_image_dir():
+    """
+    Create a scratch directory for a formatter's figures in the default
+    temporary directory (honoring TMPDIR), so they can be removed together
+    """
+    return tempfile.mkdtemp(prefix="pynnmap_report_")
+
+
 def make_figure_table(image_files):
     """
     Create a table of images from existing image files
     """
     cols = 2
-    table_data = []
-    row_data = []
-    for i, fn in enumerate(image_files):
-        row_data.append(p.Image(fn, 3.4 * u.inch, 3.0 * u.inch))
-        if (i % cols) == (cols - 1):
-            table_data.append(row_data)
-            row_data = []
-
-    # Determine if there are any images left to print
-    if len(row_data) != 0:
-        for _ in range(len(row_data), cols):
-            row_data.append(p.Paragraph("", STYLES["body_style"]))
-        table_data.append(row_data)
+    images = [p.Image(fn, 3.4 * u.inch, 3.0 * u.inch) for fn in image_files]
+
+    # Group the images into rows, padding out the last row
+    pad = p.Paragraph("", STYLES["body_style"])
+    table_data = [
+        list(row) for row in zip_longest(*[iter(images)] * cols, fillvalue=pad)
+    ]
 
     # Style this into a reportlab table and add to the story
     width = 3.75 * u.inch
     table = p.Table(table_data, colWidths=[width, width])
-    table.setStyle(
-        p.TableStyle(
-            [
-                ("ALIGNMENT", (0, 0), (-1, -1), "CENTER"),
-                ("VALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("TOPPADDING", (0, 0), (-1, -1), 6.0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 6.0),
-            ]
-        )
-    )
+    table.setStyle(TABLE_STYLES["figure_table"])
     return table
 
 
+@lru_cache(maxsize=4)
+def _parse_stand_metadata(stand_metadata_file, _mtime):
+    """
+    Parse the stand metadata file.  _mtime is only used as part of the
+    cache key so that a changed file is parsed again
+    """
+    return XMLStandMetadataParser(stand_metadata_file)
+
+
+def get_stand_metadata_parser(stand_metadata_file):
+    """
+    Get the (cached) stand metadata parser for this file, sharing a single
+    parser across all formatters that read the same file
+    """
+    mtime = os.path.getmtime(stand_metadata_file)
+    return _parse_stand_metadata(stand_metadata_file, mtime)
+
+
+@lru_cache(maxsize=4)
+def _read_accuracy_file(accuracy_file, _mtime):
+    """
+    Read an accuracy assessment CSV file.  _mtime is only used as part of
+    the cache key so that a changed file is read again
+    """
+    return pd.read_csv(accuracy_file)
+
+
+def read_accuracy_file(accuracy_file):
+    """
+    Get an accuracy assessment data frame, only parsing the file once for
+    the continuous and categorical formatters.  Each caller gets its own
+    copy, so it is free to modify it
+    """
+    mtime = os.path.getmtime(accuracy_file)
+    return _read_accuracy_file(accuracy_file, mtime).copy()
+
+
+@lru_cache(maxsize=8)
+def _parse_report_metadata(report_metadata_file, _mtime):
+    """
+    Parse the report metadata file.  _mtime is only used as part of the
+    cache key so that a changed file is parsed again
+    """
+    return XMLReportMetadataParser(report_metadata_file)
+
+
+def get_report_metadata_parser(report_metadata_file):
+    """
+    Get the (cached) report metadata parser for this file
+    """
+    mtime = os.path.getmtime(report_metadata_file)
+    return _parse_report_metadata(report_metadata_file, mtime)
+
+
+@lru_cache(maxsize=4096)
 def txt_to_html(in_str):
     """
-    Convert text values to their HTML equivalents
+    Convert text values to their HTML equivalents.  Results are cached as
+    the same descriptions recur across attribute code lists
     """
-    replace_list = {
-        ">": "&gt;",
-        "<": "&lt;",
-        "\n": "<br/>",
-    }
-    for i in replace_list:
-        in_str = re.sub(i, replace_list[i], in_str)
-    return in_str
+    # Most text has nothing to replace, so skip the translation entirely
+    if "<" not in in_str and ">" not in in_str and "\n" not in in_str:
+        return in_str
+    return in_str.translate(HTML_TRANSLATION)
 
 
 class ReportFormatter:
@@ -82,14 +182,18 @@ class ReportFormatter:
     the accuracy assessment report.
     """
 
+    # Subclasses may declare their own __slots__ to avoid a per-instance
+    # __dict__
+    __slots__ = ()
+
     _required = []
 
     # Set up an enumeration for the different pages
     (TITLE, PORTRAIT, LANDSCAPE) = ("title", "portrait", "landscape")
 
-    def __init__(self):
-        self.styles = get_paragraph_styles("Open-Sans")
-        self.table_styles = get_table_styles()
+    # Paragraph and table styles are built once and shared by all formatters
+    styles = STYLES
+    table_styles = TABLE_STYLES
 
     def check_missing_files(self):
         """
@@ -104,11 +208,12 @@ class ReportFormatter:
             raise err
 
     def create_section_title(self, title_str):
-        title_str = txt_to_html(title_str)
-        title_str = f"<strong>{title_str}</strong>"
+        # The section style is already bold, and the same titles recur
+        # across reports, so reuse the parsed paragraph
+        para = static_paragraph(txt_to_html(title_str), "section_style")
         return [
             p.Table(
-                [[p.Paragraph(title_str, self.styles["section_style"])]],
+                [[para]],
                 colWidths=[7.5 * u.inch],
                 style=self.table_styles["title"],
             ),
@@ -120,4 +225,3 @@ class ReportFormatter:
         Optional function to implement by subclasses to clean up temporary
         files
         """
-        pass
@@ -1,11 +1,35 @@
 """
 Paragraph, table and document styles used in report creation
 """
+from functools import lru_cache
+
 from reportlab import platypus as p
 from reportlab.lib import colors, pagesizes, units as u
-
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
+# Page sizes and frame positions/sizes for each page orientation
+LETTER_PORTRAIT = pagesizes.portrait(pagesizes.letter)
+LETTER_LANDSCAPE = pagesizes.landscape(pagesizes.letter)
+PORTRAIT_FRAME_ARGS = (
+    0.75 * u.inch,
+    0.60 * u.inch,
+    7.00 * u.inch,
+    9.80 * u.inch,
+)
+
+# Position, sizes and corner radius of the rounded page background
+BACKGROUND_ORIGIN = (0.5 * u.inch, 0.5 * u.inch)
+PORTRAIT_BACKGROUND_SIZE = (7.5 * u.inch, 10.0 * u.inch)
+LANDSCAPE_BACKGROUND_SIZE = (10.0 * u.inch, 7.5 * u.inch)
+BACKGROUND_RADIUS = 0.15 * u.inch
+LANDSCAPE_FRAME_ARGS = (
+    0.75 * u.inch,
+    0.50 * u.inch,
+    9.50 * u.inch,
+    7.40 * u.inch,
+)
+
 
 def _do_nothing(_canvas, _doc):
     """
@@ -20,19 +44,21 @@ def _set_background(canvas_, portrait_):
     canvas_.setStrokeColor(colors.black)
     canvas_.setLineWidth(1)
     canvas_.setFillColor("#e6ded5")
-    width = 7.5 * u.inch if portrait_ else 10.0 * u.inch
-    height = 10.0 * u.inch if portrait_ else 7.5 * u.inch
+    size = PORTRAIT_BACKGROUND_SIZE if portrait_ else LANDSCAPE_BACKGROUND_SIZE
     canvas_.roundRect(
-        0.5 * u.inch,
-        0.5 * u.inch,
-        width,
-        height,
-        0.15 * u.inch,
-        stroke=1,
-        fill=1,
+        *BACKGROUND_ORIGIN, *size, BACKGROUND_RADIUS, stroke=1, fill=1
     )
 
 
+@lru_cache(maxsize=8)
+def get_image_reader(image_file):
+    """
+    Get a (cached) image reader so that an image drawn directly on the
+    canvas is only read and decoded once
+    """
+    return ImageReader(image_file)
+
+
 def title(canvas_, _doc):
     """
     Create the title page which has the LEMMA logo on it
@@ -44,7 +70,7 @@ def title(canvas_, _doc):
         "lemma_logo.gif"
     )
     canvas_.drawImage(
-        lemma_img,
+        get_image_reader(lemma_img),
         0.5 * u.inch,
         7.5 * u.inch,
         width=7.5 * u.inch,
@@ -90,21 +116,10 @@ class GnnDocTemplate(p.BaseDocTemplate):
         # Recalculate in case we changed margins, sizes, etc
         self._calc()
 
-        frame_portrait = p.Frame(
-            0.75 * u.inch,
-            0.60 * u.inch,
-            7.00 * u.inch,
-            9.80 * u.inch,
-            id="portrait_frame",
-        )
-
-        frame_landscape = p.Frame(
-            0.75 * u.inch,
-            0.50 * u.inch,
-            9.50 * u.inch,
-            7.40 * u.inch,
-            id="landscape_frame",
-        )
+        # Frames hold layout state while a document is built, so new ones
+        # are created for each build
+        frame_portrait = p.Frame(*PORTRAIT_FRAME_ARGS, id="portrait_frame")
+        frame_landscape = p.Frame(*LANDSCAPE_FRAME_ARGS, id="landscape_frame")
 
         self.addPageTemplates(
             [
@@ -112,19 +127,19 @@ class GnnDocTemplate(p.BaseDocTemplate):
                     id="title",
                     frames=frame_portrait,
                     onPage=self.on_title,
-                    pagesize=pagesizes.portrait(pagesizes.letter),
+                    pagesize=LETTER_PORTRAIT,
                 ),
                 p.PageTemplate(
                     id="portrait",
                     frames=frame_portrait,
                     onPage=self.on_portrait,
-                    pagesize=pagesizes.portrait(pagesizes.letter),
+                    pagesize=LETTER_PORTRAIT,
                 ),
                 p.PageTemplate(
                     id="landscape",
                     frames=frame_landscape,
                     onPage=self.on_landscape,
-                    pagesize=pagesizes.landscape(pagesizes.letter),
+                    pagesize=LETTER_LANDSCAPE,
                 ),
             ]
         )
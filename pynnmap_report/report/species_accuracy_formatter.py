@@ -1,7 +1,7 @@
 """
 Formatter to report species accuracy including kappas
 """
-from typing import Any, List
+from typing import Any, Dict, List
 
 import pandas as pd
 from reportlab import platypus as p
@@ -9,9 +9,35 @@ from reportlab.lib import colors
 from reportlab.lib import units as u
 
 from pynnmap.parser import xml_report_metadata_parser as xrmp
-from pynnmap.parser import xml_stand_metadata_parser as xsmp
 
-from .report_formatter import ReportFormatter, page_break
+from .report_formatter import (
+    ReportFormatter,
+    get_report_metadata_parser,
+    get_stand_metadata_parser,
+    page_break,
+)
+
+# Species accuracy fields reported for each species
+SPECIES_FIELDS = ["PREVALENCE", "OP_PP", "OP_PA", "OA_PP", "OA_PA", "KAPPA"]
+
+
+def species_label(
+    spp: str, metadata: xrmp.XMLReportMetadataParser = None
+) -> str:
+    """
+    Build the species label from the report metadata, falling back to the
+    species code if there is no metadata for it
+    """
+    if metadata is None:
+        return spp
+    try:
+        spp_info = metadata.get_species(spp.split("_", 1)[0])
+    except IndexError:
+        return spp
+    return (
+        f"{spp_info.spp_symbol}<br/>"
+        f"{spp_info.scientific_name}/{spp_info.common_name}"
+    )
 
 
 class SpeciesAccuracyFormatter(ReportFormatter):
@@ -19,6 +45,12 @@ class SpeciesAccuracyFormatter(ReportFormatter):
     Formatter to report species accuracy including kappas
     """
 
+    __slots__ = (
+        "species_accuracy_file",
+        "stand_metadata_file",
+        "report_metadata_file",
+    )
+
     _required = ["species_accuracy_file", "stand_metadata_file"]
 
     def __init__(self, parameter_parser):
@@ -43,21 +75,7 @@ class SpeciesAccuracyFormatter(ReportFormatter):
         table.setStyle(self.table_styles["default_shaded"])
         return table
 
-    def species_name(
-        self, spp: str, metadata: xrmp.XMLReportMetadataParser = None
-    ) -> p.Paragraph:
-        if metadata is not None:
-            try:
-                spp_plain = spp.split("_")[0]
-                spp_info = metadata.get_species(spp_plain)
-                spp_str = (
-                    f"{spp_info.spp_symbol}<br/>"
-                    f"{spp_info.scientific_name}/{spp_info.common_name}"
-                )
-            except IndexError:
-                spp_str = spp
-        else:
-            spp_str = spp
+    def species_name(self, spp_str: str) -> p.Paragraph:
         return p.Paragraph(spp_str, self.styles["contact_style"])
 
     def count_table(self, plot_counts: List[int]) -> p.Table:
@@ -73,23 +91,20 @@ class SpeciesAccuracyFormatter(ReportFormatter):
         return count_table
 
     def build_species_table_row(
-        self,
-        spp: str,
-        spp_df: pd.DataFrame,
-        metadata: xrmp.XMLReportMetadataParser = None,
+        self, spp_str: str, spp_data: Dict[str, Any]
     ) -> List[Any]:
-        spp_data = spp_df[spp_df.SPECIES == spp].squeeze()
         plot_counts = [
-            getattr(spp_data, x) for x in ("OP_PP", "OP_PA", "OA_PP", "OA_PA")
+            spp_data[x] for x in ("OP_PP", "OP_PA", "OA_PP", "OA_PA")
         ]
         return [
-            self.species_name(spp, metadata),
+            self.species_name(spp_str),
             p.Paragraph(
-                f"{spp_data.PREVALENCE:.4f}", self.styles["contact_style_right"]
+                f"{spp_data['PREVALENCE']:.4f}",
+                self.styles["contact_style_right"],
             ),
             self.count_table(plot_counts),
             p.Paragraph(
-                f"{spp_data.KAPPA:.4f}", self.styles["contact_style_right"]
+                f"{spp_data['KAPPA']:.4f}", self.styles["contact_style_right"]
             ),
         ]
 
@@ -180,11 +195,11 @@ class SpeciesAccuracyFormatter(ReportFormatter):
         spp_df = pd.read_csv(self.species_accuracy_file)
 
         # Read in the stand attribute metadata
-        metadata_parser = xsmp.XMLStandMetadataParser(self.stand_metadata_file)
+        metadata_parser = get_stand_metadata_parser(self.stand_metadata_file)
 
         # Read in the report metadata if it exists
         if self.report_metadata_file:
-            rmp = xrmp.XMLReportMetadataParser(self.report_metadata_file)
+            rmp = get_report_metadata_parser(self.report_metadata_file)
         else:
             rmp = None
 
@@ -199,9 +214,23 @@ class SpeciesAccuracyFormatter(ReportFormatter):
         common_species = spp_df[spp_df.PREVALENCE >= 0.005].SPECIES
         attrs = sorted(list(set(attrs) & set(common_species)))
 
+        # Look up the accuracy information for all species at once rather
+        # than scanning the data frame for each species
+        records = (
+            spp_df.set_index("SPECIES")
+            .loc[attrs, SPECIES_FIELDS]
+            .to_dict("index")
+        )
+
+        # Look up the species labels once for this report
+        labels = {spp: species_label(spp, rmp) for spp in attrs}
+
         # Build the table with accuracy information
         species_table.extend(
-            [self.build_species_table_row(spp, spp_df, rmp) for spp in attrs]
+            [
+                self.build_species_table_row(labels[spp], records[spp])
+                for spp in attrs
+            ]
         )
 
         # Style this into a reportlab table and add to the story
@@ -213,6 +242,3 @@ class SpeciesAccuracyFormatter(ReportFormatter):
 
         # Return this story
         return story
-
-    def clean_up(self):
-        pass
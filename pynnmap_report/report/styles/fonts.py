@@ -8,9 +8,11 @@ from ..config import FontConfig
 
 def register_font(font_name, file_name):
     """
-    Register a font with reportlab
+    Register a font with reportlab, skipping fonts that are already
+    registered so that the font file is only parsed once
     """
-    pdfmetrics.registerFont(TTFont(font_name, file_name))
+    if font_name not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(TTFont(font_name, file_name))
     return font_name
 
 
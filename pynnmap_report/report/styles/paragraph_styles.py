@@ -1,6 +1,8 @@
 """
 Paragraph styles used in report creation
 """
+from functools import lru_cache
+
 from reportlab.lib import enums, units as u
 from reportlab.lib.styles import ParagraphStyle
 
@@ -90,6 +92,18 @@ def get_garamond_styles(font_dict):
         leading=16 * lead_multiplier,
     )
 
+    styles["body_style_spaced"] = ParagraphStyle(
+        name="BodySpaced",
+        parent=styles["body_style"],
+        spaceAfter=0.1 * u.inch,
+    )
+
+    styles["heading_style_spaced"] = ParagraphStyle(
+        name="HeadingSpaced",
+        parent=styles["heading_style"],
+        spaceAfter=0.1 * u.inch,
+    )
+
     styles["code_style"] = ParagraphStyle(
         name="Code",
         parent=styles["body_style"],
@@ -213,6 +227,18 @@ def get_open_sans_styles(font_dict):
         leading=14 * lead_multiplier,
     )
 
+    styles["body_style_spaced"] = ParagraphStyle(
+        name="BodySpaced",
+        parent=styles["body_style"],
+        spaceAfter=0.1 * u.inch,
+    )
+
+    styles["heading_style_spaced"] = ParagraphStyle(
+        name="HeadingSpaced",
+        parent=styles["heading_style"],
+        spaceAfter=0.1 * u.inch,
+    )
+
     styles["code_style"] = ParagraphStyle(
         name="Code",
         parent=styles["body_style"],
@@ -304,9 +330,11 @@ def get_open_sans_styles(font_dict):
     return styles
 
 
+@lru_cache(maxsize=None)
 def get_paragraph_styles(font_family):
     """
-    Build custom paragraph and table styles and return to caller
+    Build custom paragraph and table styles and return to caller.  The
+    styles are built once per font family and shared between callers
     """
     family = FONTS[font_family]
     style_dict = {
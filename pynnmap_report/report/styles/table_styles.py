@@ -1,7 +1,10 @@
+from functools import lru_cache
+
 from reportlab.platypus import TableStyle
 from reportlab.lib import colors
 
 
+@lru_cache(maxsize=None)
 def get_table_styles():
     styles = {
         "default": TableStyle(
@@ -49,10 +52,6 @@ def get_table_styles():
 
     styles["plot_listing"] = TableStyle(
         [
-            ("TOPPADDING", (2, 1), (2, -2), 0),
-            ("BOTTOMPADDING", (2, 1), (2, -2), 0),
-            ("LEFTPADDING", (2, 1), (2, -2), 0),
-            ("RIGHTPADDING", (2, 1), (2, -2), 0),
             ("TOPPADDING", (0, -1), (2, -1), 4),
             ("BOTTOMPADDING", (0, -1), (2, -1), 4),
             ("ALIGNMENT", (0, -1), (2, -1), "RIGHT"),
@@ -113,18 +112,6 @@ def get_table_styles():
         parent=styles["default_shaded"],
     )
 
-    styles["description_table"] = TableStyle(
-        [
-            ("TOPPADDING", (0, 0), (-1, 0), 0),
-            ("TOPPADDING", (0, 1), (-1, -1), 6),
-            ("BOTTOMPADDING", (0, -1), (-1, -1), 0),
-            ("BOTTOMPADDING", (0, 0), (-1, -2), 6),
-            ("LEFTPADDING", (0, 0), (-1, -1), 0),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-        ],
-        parent=styles["default"],
-    )
-
     styles["code_table"] = TableStyle(
         [
             ("TOPPADDING", (0, 0), (-1, -1), 3),
@@ -134,4 +121,40 @@ def get_table_styles():
         parent=styles["default_shaded"],
     )
 
+    styles["figure_table"] = TableStyle(
+        [
+            ("ALIGNMENT", (0, 0), (-1, -1), "CENTER"),
+            ("VALIGN", (0, 0), (-1, -1), "CENTER"),
+            ("TOPPADDING", (0, 0), (-1, -1), 6.0),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 6.0),
+        ]
+    )
+
+    styles["vegclass_title"] = TableStyle(
+        [
+            ("TOPPADDING", (0, 0), (-1, -1), 3),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+            ("BACKGROUND", (0, 0), (-1, -1), "#957348"),
+            ("ALIGNMENT", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
+        ]
+    )
+
+    styles["vegclass_matrix"] = TableStyle(
+        [
+            ("SPAN", (0, 0), (1, 1)),
+            ("SPAN", (0, 2), (0, -1)),
+            ("SPAN", (2, 0), (-1, 0)),
+            ("BACKGROUND", (0, 0), (-1, -1), "#f1efe4"),
+            ("GRID", (0, 0), (-1, -1), 1, colors.white),
+            ("ALIGNMENT", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("VALIGN", (0, 2), (0, -1), "MIDDLE"),
+            ("VALIGN", (2, 1), (-1, 1), "MIDDLE"),
+            ("TOPPADDING", (0, 0), (-1, -1), 2),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+        ]
+    )
+
     return styles
@@ -1,17 +1,16 @@
 """
 Formatter to create an error matrix of vegetation class
 """
-import re
-
 import pandas as pd
 from reportlab import platypus as p
-from reportlab.lib import colors
 from reportlab.lib import units as u
 
-from pynnmap.parser import xml_stand_metadata_parser as xsmp
-
-from . import report_styles
-from .report_formatter import ReportFormatter, page_break, txt_to_html
+from .report_formatter import (
+    ReportFormatter,
+    get_stand_metadata_parser,
+    page_break,
+    txt_to_html,
+)
 
 
 class VegetationClassFormatter(ReportFormatter):
@@ -19,6 +18,11 @@ class VegetationClassFormatter(ReportFormatter):
     Formatter to create an error matrix of vegetation class
     """
 
+    __slots__ = (
+        "vc_errmatrix_file",
+        "stand_metadata_file",
+    )
+
     _required = ["vc_errmatrix_file", "stand_metadata_file"]
 
     def __init__(self, parameter_parser):
@@ -40,8 +44,8 @@ class VegetationClassFormatter(ReportFormatter):
         # Set up an empty list to hold the story
         story = []
 
-        # Import the report styles
-        styles = report_styles.get_report_styles()
+        # Use the shared report styles
+        styles = self.styles
 
         # Create a page break
         story.extend(page_break(self.LANDSCAPE))
@@ -71,18 +75,10 @@ class VegetationClassFormatter(ReportFormatter):
         )
 
         para = p.Paragraph(title_str, styles["section_style"])
-        table = p.Table([[para]], colWidths=[10.0 * u.inch])
-        table.setStyle(
-            p.TableStyle(
-                [
-                    ("TOPPADDING", (0, 0), (-1, -1), 3),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                    ("BACKGROUND", (0, 0), (-1, -1), "#957348"),
-                    ("ALIGNMENT", (0, 0), (-1, -1), "LEFT"),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("GRID", (0, 0), (-1, -1), 0.25, colors.black),
-                ]
-            )
+        table = p.Table(
+            [[para]],
+            colWidths=[10.0 * u.inch],
+            style=self.table_styles["vegclass_title"],
         )
         story.extend((table, p.Spacer(0, 0.1 * u.inch)))
 
@@ -90,7 +86,7 @@ class VegetationClassFormatter(ReportFormatter):
         vc_df = self.read_error_matrix()
 
         # Read in the stand attribute metadata
-        metadata_parser = xsmp.XMLStandMetadataParser(self.stand_metadata_file)
+        metadata_parser = get_stand_metadata_parser(self.stand_metadata_file)
 
         # Get the class names from the metadata
         vegclass_metadata = metadata_parser.get_attribute("VEGCLASS")
@@ -108,11 +104,11 @@ class VegetationClassFormatter(ReportFormatter):
         summary_labels = ("Total", "% Correct", "% FCorrect")
         header_row = ["" for _ in range(2)]
         for code in vc_codes:
-            label = re.sub("-", "-<br/>", code.label)
+            label = code.label.replace("-", "-<br/>")
             para = p.Paragraph(label, styles["body_style_10_right"])
             header_row.append(para)
         for label in summary_labels:
-            label = re.sub(" ", "<br/>", label)
+            label = label.replace(" ", "<br/>")
             para = p.Paragraph(label, styles["body_style_10_right"])
             header_row.append(para)
         vegclass_table.append(header_row)
@@ -178,47 +174,18 @@ class VegetationClassFormatter(ReportFormatter):
         widths = [x * u.inch for x in widths]
 
         # Convert the vegclass table into a reportlab table
-        table = p.Table(vegclass_table, colWidths=widths)
-        table.setStyle(
-            p.TableStyle(
-                [
-                    ("SPAN", (0, 0), (1, 1)),
-                    ("SPAN", (0, 2), (0, -1)),
-                    ("SPAN", (2, 0), (-1, 0)),
-                    ("BACKGROUND", (0, 0), (-1, -1), "#f1efe4"),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.white),
-                    ("ALIGNMENT", (0, 0), (-1, -1), "LEFT"),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("VALIGN", (0, 2), (0, -1), "MIDDLE"),
-                    ("VALIGN", (2, 1), (-1, 1), "MIDDLE"),
-                    ("TOPPADDING", (0, 0), (-1, -1), 2),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-                ]
-            )
+        table = p.Table(
+            vegclass_table,
+            colWidths=widths,
+            style=self.table_styles["vegclass_matrix"],
         )
 
-        # Set up the shading for the truly correct cells
-        correct = {}
-        for i in range(len(vc_codes)):
-            val = i + 1
-            correct[val] = val
-
-        for key in correct:
-            val = correct[key]
-            table.setStyle(
-                p.TableStyle(
-                    [
-                        (
-                            "BACKGROUND",
-                            (key + 1, val + 1),
-                            (key + 1, val + 1),
-                            "#aaaaaa",
-                        ),
-                    ]
-                )
-            )
-
-        # Set up the shading for the fuzzy correct cells
+        # Shade the truly correct (diagonal) cells dark gray and the fuzzy
+        # correct cells light gray, applying all cell commands at once
+        shading = [
+            ("BACKGROUND", (i + 1, i + 1), (i + 1, i + 1), "#aaaaaa")
+            for i in range(1, len(vc_codes) + 1)
+        ]
         fuzzy = {
             1: [2],
             2: [1, 3, 5, 8],
@@ -232,21 +199,12 @@ class VegetationClassFormatter(ReportFormatter):
             10: [7, 9, 11],
             11: [7, 10],
         }
-
-        for key in fuzzy:
-            for elem in fuzzy[key]:
-                table.setStyle(
-                    p.TableStyle(
-                        [
-                            (
-                                "BACKGROUND",
-                                (key + 1, elem + 1),
-                                (key + 1, elem + 1),
-                                "#dddddd",
-                            ),
-                        ]
-                    )
-                )
+        shading.extend(
+            ("BACKGROUND", (key + 1, elem + 1), (key + 1, elem + 1), "#dddddd")
+            for key, elems in fuzzy.items()
+            for elem in elems
+        )
+        table.setStyle(p.TableStyle(shading))
 
         # Add this table to the story
         story.extend((table, p.Spacer(0, 0.1 * u.inch)))
@@ -282,6 +240,3 @@ class VegetationClassFormatter(ReportFormatter):
             story.append(para)
 
         return story
-
-    def clean_up(self):
-        pass